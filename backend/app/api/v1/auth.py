@@ -13,7 +13,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @limiter.limit("10/minute")
 @router.post("/login", response_model=TokenResponse)
 async def login(
-    request_obj: Request,
+    request: Request,
     data: LoginRequest,
     db: DbSession,
 ) -> TokenResponse:
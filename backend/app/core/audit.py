@@ -3,16 +3,113 @@
 Implements hash chaining and Ed25519 signatures for interaction records.
 """
 
+import base64
 import hashlib
 import json
-from datetime import datetime
+import multiprocessing
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
+import cbor2
+import orjson
+
 from app.core.ed25519 import get_gateway_key_manager
 from app.core.logging import get_logger
 
 logger = get_logger("core.audit")
 
+# Datetimes serialize in the encoder: UTC offsets render as Z and
+# sub-second precision is dropped so equivalent timestamps canonicalize
+# identically regardless of source resolution.
+_CANONICAL_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_OMIT_MICROSECONDS
+
+# orjson only serializes integers representable in 64 bits; anything
+# outside this range takes the stdlib fallback in _canonical_dumps.
+_INT64_MIN = -(2**63)
+_UINT64_MAX = 2**64 - 1
+
+
+# Sorted key order per distinct key set. Canonicalized dicts (records,
+# policy checks, request envelopes) reuse a handful of shapes, so the
+# sort runs once per shape instead of once per dict. Bounded so
+# adversarial payloads with ever-new key sets cannot grow it unbounded.
+_key_order_cache: dict[frozenset, tuple] = {}
+_KEY_ORDER_CACHE_MAX = 1024
+
+
+def _sorted_keys(obj: dict) -> tuple:
+    """Return the dict's keys in sorted order, memoized on the key set."""
+    key_set = frozenset(obj)
+    order = _key_order_cache.get(key_set)
+    if order is None:
+        order = tuple(sorted(obj))
+        if len(_key_order_cache) < _KEY_ORDER_CACHE_MAX:
+            _key_order_cache[key_set] = order
+    return order
+
+
+def _normalize(obj: Any) -> Any:
+    """Recursively normalize an object for canonical serialization."""
+    if obj is None:
+        return None
+    if isinstance(obj, bool):
+        return obj
+    if isinstance(obj, int):
+        return obj
+    if isinstance(obj, float):
+        # Normalize floats to avoid precision issues. The int fold is
+        # bounded to orjson's 64-bit range so e.g. 1e20 stays a float
+        # instead of manufacturing an unserializable int.
+        if obj == int(obj) and _INT64_MIN <= obj <= _UINT64_MAX:
+            return int(obj)
+        return round(obj, 10)
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, datetime):
+        # Left as-is: orjson and cbor2 both encode datetimes natively,
+        # faster than isoformat() plus string encoding in Python.
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(item) for item in obj]
+    if isinstance(obj, dict):
+        return {str(k): _normalize(obj[k]) for k in _sorted_keys(obj)}
+    # For other types, convert to string
+    return str(obj)
+
+
+def _json_fallback_default(obj: Any) -> str:
+    """Match orjson's datetime rendering on the stdlib fallback path."""
+    if isinstance(obj, datetime):
+        rendered = obj.replace(microsecond=0).isoformat()
+        if rendered.endswith("+00:00"):
+            return rendered[:-6] + "Z"
+        return rendered
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _canonical_dumps(data: Any) -> bytes:
+    """Serialize normalized data to canonical JSON bytes.
+
+    orjson is the fast path; integers outside the 64-bit range make it
+    raise TypeError, so those payloads (agent-supplied amounts or
+    metadata can be arbitrarily large ints) fall back to stdlib json,
+    which serializes arbitrary precision, instead of failing the audit
+    write.
+    """
+    normalized = _normalize(data)
+    try:
+        return orjson.dumps(normalized, option=_CANONICAL_ORJSON_OPTIONS)
+    except TypeError:
+        return json.dumps(
+            normalized,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_json_fallback_default,
+        ).encode()
+
 
 def canonicalize_json(data: Any) -> str:
     """Convert data to canonical JSON format for hashing.
@@ -20,37 +117,15 @@ def canonicalize_json(data: Any) -> str:
     Canonical format ensures deterministic serialization:
     - Keys are sorted alphabetically
     - No whitespace between elements
-    - Unicode escaped
     - Null values preserved
     - Floats normalized
-    """
 
-    def normalize(obj: Any) -> Any:
-        """Recursively normalize object for canonical form."""
-        if obj is None:
-            return None
-        if isinstance(obj, bool):
-            return obj
-        if isinstance(obj, int):
-            return obj
-        if isinstance(obj, float):
-            # Normalize floats to avoid precision issues
-            if obj == int(obj):
-                return int(obj)
-            return round(obj, 10)
-        if isinstance(obj, str):
-            return obj
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (list, tuple)):
-            return [normalize(item) for item in obj]
-        if isinstance(obj, dict):
-            return {str(k): normalize(v) for k, v in sorted(obj.items())}
-        # For other types, convert to string
-        return str(obj)
-
-    normalized = normalize(data)
-    return json.dumps(normalized, separators=(",", ":"), ensure_ascii=True, sort_keys=True)
+    One Python-level normalization pass handles float folding; the
+    actual serialization, including RFC 3339 datetimes (UTC rendered as
+    Z, microseconds dropped), runs in orjson's native encoder with a
+    stdlib fallback for integers beyond 64 bits.
+    """
+    return _canonical_dumps(data).decode()
 
 
 def compute_hash(data: str) -> str:
@@ -61,13 +136,39 @@ def compute_hash(data: str) -> str:
     return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=4096)
+def _request_hash_for_canonical(canonical: bytes) -> str:
+    """Hash a canonical request payload, memoized on the canonical form.
+
+    Retries and chain re-verification hash the same request bodies
+    repeatedly; the cache turns those repeats into a dict lookup.
+    """
+    return hashlib.sha256(canonical).hexdigest()
+
+
 def compute_request_hash(request_data: dict) -> str:
     """Compute hash of the request data.
 
-    Used to uniquely identify the request content.
+    Used to uniquely identify the request content. The hash input is
+    canonical CBOR (RFC 8949) rather than canonical JSON: the binary
+    encoding skips string escaping and UTF-8 re-encoding of the
+    serialized form. Request hashes are opaque identifiers, so the
+    wire format never surfaces; canonicalize_json remains the format
+    for anything that is stored or displayed.
     """
-    canonical = canonicalize_json(request_data)
-    return compute_hash(canonical)
+    # timezone=UTC keeps naive datetimes encodable (and deterministic)
+    # now that _normalize no longer pre-converts them to strings.
+    return _request_hash_for_canonical(
+        cbor2.dumps(_normalize(request_data), canonical=True, timezone=UTC)
+    )
+
+
+# Dispatch on the exact payload type; one dict lookup replaces branch
+# checks on the hot path. Unlisted types fall back to the canonical path.
+_RESULT_HASHERS: dict[type, Any] = {
+    type(None): lambda _data: None,
+    dict: lambda data: compute_hash(canonicalize_json(data)),
+}
 
 
 def compute_result_hash(result_data: dict | None) -> str | None:
@@ -75,10 +176,10 @@ def compute_result_hash(result_data: dict | None) -> str | None:
 
     Returns None if no result.
     """
-    if result_data is None:
-        return None
-    canonical = canonicalize_json(result_data)
-    return compute_hash(canonical)
+    hasher = _RESULT_HASHERS.get(type(result_data))
+    if hasher is None:
+        return compute_hash(canonicalize_json(result_data))
+    return hasher(result_data)
 
 
 def compute_record_hash(
@@ -98,10 +199,58 @@ def compute_record_hash(
 ) -> str:
     """Compute the tamper-evident hash of a record.
 
-    The record hash is computed over a canonical subset of fields
-    plus the previous record hash to form a chain.
+    The record hash is computed over a fixed, ordered field layout
+    plus the previous record hash to form a chain. Each field is
+    length-prefixed (see _update_with_fields), so the encoding is
+    unambiguous regardless of field content, and streamed straight into
+    the digest.
+    """
+    created = created_at.isoformat() if isinstance(created_at, datetime) else created_at
+    h = hashlib.sha256()
+    _update_with_fields(
+        h.update,
+        (
+            record_id,
+            org_id,
+            uapk_id,
+            agent_id,
+            action_type,
+            tool,
+            request_hash,
+            decision,
+            reasons_json,
+            policy_trace_json,
+            result_hash,
+            previous_record_hash,
+            created,
+        ),
+    )
+    return h.hexdigest()
+
+
+def compute_record_hash_legacy(
+    record_id: str,
+    org_id: str,
+    uapk_id: str,
+    agent_id: str,
+    action_type: str,
+    tool: str,
+    request_hash: str,
+    decision: str,
+    reasons_json: str,
+    policy_trace_json: str,
+    result_hash: str | None,
+    previous_record_hash: str | None,
+    created_at: datetime,
+) -> str:
+    """Compute a record hash in the original canonical-JSON layout.
+
+    Chains persisted before the length-prefixed binary layout shipped
+    were hashed over canonical JSON (stdlib dumps, unicode-escaped,
+    full datetime precision). Verification paths fall back to this
+    format per record so existing chains keep verifying; new records
+    are always written with compute_record_hash above.
     """
-    # Build canonical data structure
     record_data = {
         "record_id": record_id,
         "org_id": org_id,
@@ -118,8 +267,175 @@ def compute_record_hash(
         "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
     }
 
-    canonical = canonicalize_json(record_data)
-    return compute_hash(canonical)
+    # Every field is a string or None, so this reproduces the old
+    # canonicalize_json output byte-for-byte without the normalization
+    # pass (the current canonicalizer renders datetimes differently and
+    # no longer unicode-escapes, so it cannot be reused here).
+    canonical = json.dumps(record_data, separators=(",", ":"), ensure_ascii=True, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _hash_record_legacy(record: dict) -> str:
+    """compute_record_hash_legacy over the dict shape used by the bulk path."""
+    return compute_record_hash_legacy(
+        record_id=record["record_id"],
+        org_id=record["org_id"],
+        uapk_id=record["uapk_id"],
+        agent_id=record["agent_id"],
+        action_type=record["action_type"],
+        tool=record["tool"],
+        request_hash=record["request_hash"],
+        decision=record["decision"],
+        reasons_json=record["reasons_json"],
+        policy_trace_json=record["policy_trace_json"],
+        result_hash=record.get("result_hash"),
+        previous_record_hash=record.get("previous_record_hash"),
+        created_at=record["created_at"],
+    )
+
+
+# Little-endian uint32 length prefix for each hashed field; None fields
+# carry the max-uint32 sentinel, which no real length can reach (fields
+# are far below 4 GiB).
+_pack_length = struct.Struct("<I").pack
+_NONE_FIELD = _pack_length(0xFFFFFFFF)
+
+
+def _update_with_fields(update, fields: tuple[str | None, ...]) -> None:
+    """Stream length-prefixed UTF-8 field segments into a hash update().
+
+    Feeding the digest incrementally skips assembling (and then copying)
+    a single concatenated buffer per record.
+    """
+    for field in fields:
+        if field is None:
+            update(_NONE_FIELD)
+        else:
+            encoded = field.encode("utf-8")
+            update(_pack_length(len(encoded)))
+            update(encoded)
+
+
+# Record fields hashed by the chain, in layout order. The first group is
+# required (KeyError on absence surfaces as a per-record failure), the
+# second is optional and defaults to None.
+_REQUIRED_RECORD_FIELDS = (
+    "record_id",
+    "org_id",
+    "uapk_id",
+    "agent_id",
+    "action_type",
+    "tool",
+    "request_hash",
+    "decision",
+    "reasons_json",
+    "policy_trace_json",
+)
+_OPTIONAL_RECORD_FIELDS = ("result_hash", "previous_record_hash")
+
+
+def _build_record_hasher():
+    """Generate a monomorphic hasher for the fixed record layout.
+
+    The field set is static, so the generated function names each field
+    directly instead of looping over a tuple, and streams every segment
+    straight into the digest with update() rather than concatenating a
+    per-record buffer. The layout stays defined in one place above.
+    """
+    lines = ["def _hash_record(record):", "    h = sha256()", "    update = h.update"]
+
+    def emit(expr: str) -> None:
+        lines.extend(
+            [
+                f"    field = {expr}",
+                "    if field is None:",
+                "        update(_NONE_FIELD)",
+                "    else:",
+                "        encoded = field.encode('utf-8')",
+                "        update(_pack_length(len(encoded)))",
+                "        update(encoded)",
+            ]
+        )
+
+    for name in _REQUIRED_RECORD_FIELDS:
+        emit(f"record[{name!r}]")
+    for name in _OPTIONAL_RECORD_FIELDS:
+        emit(f"record.get({name!r})")
+    lines.extend(
+        [
+            "    created = record['created_at']",
+            "    if isinstance(created, datetime):",
+            "        created = created.isoformat()",
+        ]
+    )
+    emit("created")
+    lines.append("    return h.digest()")
+
+    namespace = {
+        "sha256": hashlib.sha256,
+        "_pack_length": _pack_length,
+        "_NONE_FIELD": _NONE_FIELD,
+        "datetime": datetime,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_hash_record"]
+
+
+_hash_record = _build_record_hasher()
+
+
+# Chains shorter than this are hashed in-process; starting workers costs
+# more than the hashing itself for small batches.
+_PARALLEL_HASH_THRESHOLD = 5000
+_PARALLEL_HASH_CHUNK_SIZE = 1024
+
+# Workers are spawned rather than forked: this module is imported inside
+# live ASGI workers, and forking a process with a running event loop and
+# open database sockets risks deadlocks and inherited fds.
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _hash_record_chunk(records: list[dict]) -> list[bytes | Exception]:
+    """Sequentially hash a chunk of records (worker body for the pool)."""
+    hash_record = _hash_record
+    hashes: list[bytes | Exception] = []
+    for record in records:
+        try:
+            hashes.append(hash_record(record))
+        except Exception as e:
+            hashes.append(e)
+    return hashes
+
+
+def compute_record_hashes(
+    records: list[dict], parallel: bool = False
+) -> list[bytes | Exception]:
+    """Recompute record hashes for many records.
+
+    Returns raw 32-byte digests (compare with stored hex via
+    bytes.fromhex) rather than hex strings; verification only needs
+    equality, and hex-encoding every digest roughly doubles the bytes
+    touched per record. The digest work already runs in C via
+    hashlib/OpenSSL; this helper strips the remaining per-record Python
+    overhead (a thirteen-keyword call into compute_record_hash plus
+    repeated global lookups) when verifying whole chains. Per-record
+    failures are returned in place of the digest so callers can report
+    them positionally.
+
+    parallel is an opt-in for offline/CLI callers only: it splits large
+    chains into fixed-size chunks hashed across spawned worker
+    processes, and the synchronous pool.map would block an event loop,
+    so request paths must keep the serial default.
+    """
+    if not parallel or len(records) < _PARALLEL_HASH_THRESHOLD:
+        return _hash_record_chunk(records)
+
+    chunks = [
+        records[start : start + _PARALLEL_HASH_CHUNK_SIZE]
+        for start in range(0, len(records), _PARALLEL_HASH_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(mp_context=_SPAWN_CONTEXT) as pool:
+        return [h for chunk in pool.map(_hash_record_chunk, chunks) for h in chunk]
 
 
 def sign_record_hash(record_hash: str) -> str:
@@ -127,8 +443,6 @@ def sign_record_hash(record_hash: str) -> str:
 
     Returns base64-encoded signature.
     """
-    import base64
-
     key_manager = get_gateway_key_manager()
     signature_bytes = key_manager.sign(record_hash.encode("utf-8"))
     return base64.b64encode(signature_bytes).decode("utf-8")
@@ -139,8 +453,6 @@ def verify_record_signature(record_hash: str, signature: str) -> bool:
 
     Returns True if signature is valid.
     """
-    import base64
-
     try:
         key_manager = get_gateway_key_manager()
         signature_bytes = base64.b64decode(signature)
@@ -151,11 +463,13 @@ def verify_record_signature(record_hash: str, signature: str) -> bool:
         return False
 
 
-def verify_hash_chain(records: list[dict]) -> tuple[bool, list[str]]:
+def verify_hash_chain(records: list[dict], parallel: bool = False) -> tuple[bool, list[str]]:
     """Verify the integrity of a hash chain.
 
     Args:
         records: List of record dicts in chronological order
+        parallel: Hash large chains across worker processes. Offline/CLI
+            callers only; see compute_record_hashes.
 
     Returns:
         (is_valid, errors): Tuple of validity and list of errors
@@ -165,72 +479,128 @@ def verify_hash_chain(records: list[dict]) -> tuple[bool, list[str]]:
     if not records:
         return True, []
 
+    # Extract the chain-link columns once up front; the loop below then
+    # indexes plain lists instead of re-walking each dict per check.
+    record_ids = [r.get("record_id", f"record_{i}") for i, r in enumerate(records)]
+    stored_previous_hashes = [r.get("previous_record_hash") for r in records]
+    stored_hashes = [r.get("record_hash") for r in records]
+    signatures = [r.get("gateway_signature") for r in records]
+    computed_hashes = compute_record_hashes(records, parallel=parallel)
+    # Decode stored hex once so the hot comparison is bytes == bytes;
+    # unparseable values (tampering) decode to None and can never match.
+    stored_hash_bytes: list[bytes | None] = []
+    for stored in stored_hashes:
+        try:
+            stored_hash_bytes.append(bytes.fromhex(stored) if stored else None)
+        except ValueError:
+            stored_hash_bytes.append(None)
+
     previous_hash: str | None = None
+    legacy_count = 0
+    # (record_id, stored_hash, signature) tuples deferred to a single
+    # verification pass so the gateway key is resolved once per chain.
+    signature_checks: list[tuple[str, str, str]] = []
 
-    for i, record in enumerate(records):
-        record_id = record.get("record_id", f"record_{i}")
+    for i in range(len(records)):
+        record_id = record_ids[i]
 
         # Check previous hash matches
-        stored_previous = record.get("previous_record_hash")
+        stored_previous = stored_previous_hashes[i]
         if stored_previous != previous_hash:
             errors.append(
                 f"Record {record_id}: previous_record_hash mismatch. "
                 f"Expected {previous_hash}, got {stored_previous}"
             )
 
-        # Recompute record hash
-        try:
-            computed_hash = compute_record_hash(
-                record_id=record["record_id"],
-                org_id=record["org_id"],
-                uapk_id=record["uapk_id"],
-                agent_id=record["agent_id"],
-                action_type=record["action_type"],
-                tool=record["tool"],
-                request_hash=record["request_hash"],
-                decision=record["decision"],
-                reasons_json=record["reasons_json"],
-                policy_trace_json=record["policy_trace_json"],
-                result_hash=record.get("result_hash"),
-                previous_record_hash=record.get("previous_record_hash"),
-                created_at=record["created_at"],
+        # Check recomputed record hash (bulk pass above)
+        computed_hash = computed_hashes[i]
+        hash_ok = False
+        if isinstance(computed_hash, Exception):
+            errors.append(f"Record {record_id}: failed to compute hash: {computed_hash}")
+        elif computed_hash == stored_hash_bytes[i]:
+            hash_ok = True
+        elif stored_hashes[i] == _hash_record_legacy(records[i]):
+            # Record was persisted before the binary layout shipped;
+            # its stored hash matches the legacy canonical-JSON format.
+            legacy_count += 1
+            hash_ok = True
+        else:
+            errors.append(
+                f"Record {record_id}: record_hash mismatch. "
+                f"Expected {computed_hash.hex()}, got {stored_hashes[i]}"
             )
 
-            stored_hash = record.get("record_hash")
-            if computed_hash != stored_hash:
-                errors.append(
-                    f"Record {record_id}: record_hash mismatch. "
-                    f"Expected {computed_hash}, got {stored_hash}"
-                )
-        except Exception as e:
-            errors.append(f"Record {record_id}: failed to compute hash: {e}")
-            computed_hash = record.get("record_hash", "")
-
-        # Verify signature
-        signature = record.get("gateway_signature")
-        stored_hash = record.get("record_hash")
-        if signature and stored_hash:
-            if not verify_record_signature(stored_hash, signature):
-                errors.append(f"Record {record_id}: invalid signature")
+        # Defer signature verification to the batched pass below. Records
+        # whose hash already failed are flagged regardless of signature,
+        # so the curve arithmetic is spent only on hash-clean records.
+        signature = signatures[i]
+        stored_hash = stored_hashes[i]
+        if hash_ok and signature and stored_hash:
+            signature_checks.append((record_id, stored_hash, signature))
 
         # Update previous hash for next iteration
-        previous_hash = record.get("record_hash")
+        previous_hash = stored_hashes[i]
+
+    # Verify all signatures against a single key lookup. Ed25519 in
+    # `cryptography` has no aggregate batch-verify primitive, so this
+    # batches the Python-side overhead (key manager resolution, attribute
+    # lookups) rather than the curve arithmetic itself.
+    if signature_checks:
+        public_key = get_gateway_key_manager().public_key
+        for record_id, stored_hash, signature in signature_checks:
+            try:
+                public_key.verify(base64.b64decode(signature), stored_hash.encode("utf-8"))
+            except Exception as e:
+                logger.warning("signature_verification_failed", error=str(e))
+                errors.append(f"Record {record_id}: invalid signature")
+
+    if legacy_count:
+        logger.info("legacy_format_records_verified", record_count=legacy_count)
 
     return len(errors) == 0, errors
 
 
 class PolicyTrace:
-    """Builder for structured policy trace."""
+    """Builder for structured policy trace.
+
+    Checks are stored as parallel lists (one per column) rather than a
+    list of dicts: appending three scalars beats allocating a dict per
+    check, and the columnar layout keeps live traces compact. The
+    `checks` property materializes row dicts on demand.
+    """
+
+    __slots__ = (
+        "_check_details",
+        "_check_fragments",
+        "_check_names",
+        "_check_results",
+        "end_time",
+        "start_time",
+    )
 
     def __init__(self) -> None:
-        self.checks: list[dict] = []
+        self._check_names: list[str] = []
+        self._check_results: list[str] = []
+        self._check_details: list[dict] = []
+        # Canonical serialization of each check, built as checks are
+        # added so to_json only joins fragments instead of re-walking
+        # the whole trace.
+        self._check_fragments: list[bytes] = []
         self.start_time: datetime | None = None
         self.end_time: datetime | None = None
 
+    @property
+    def checks(self) -> list[dict]:
+        """Per-check dicts materialized from the columnar storage."""
+        return [
+            {"check": name, "result": result, "details": details}
+            for name, result, details in zip(
+                self._check_names, self._check_results, self._check_details, strict=True
+            )
+        ]
+
     def start(self) -> "PolicyTrace":
         """Mark start of policy evaluation."""
-        from datetime import UTC
-
         self.start_time = datetime.now(UTC)
         return self
 
@@ -247,17 +617,17 @@ class PolicyTrace:
             result: "pass", "fail", "skip", or "escalate"
             details: Optional additional details
         """
-        self.checks.append({
-            "check": check_name,
-            "result": result,
-            "details": details or {},
-        })
+        details = details or {}
+        self._check_names.append(check_name)
+        self._check_results.append(result)
+        self._check_details.append(details)
+        self._check_fragments.append(
+            _canonical_dumps({"check": check_name, "result": result, "details": details})
+        )
         return self
 
     def finish(self) -> "PolicyTrace":
         """Mark end of policy evaluation."""
-        from datetime import UTC
-
         self.end_time = datetime.now(UTC)
         return self
 
@@ -275,8 +645,26 @@ class PolicyTrace:
         }
 
     def to_json(self) -> str:
-        """Convert trace to canonical JSON string."""
-        return canonicalize_json(self.to_dict())
+        """Convert trace to canonical JSON string.
+
+        Joins the per-check fragments captured in add_check, so the cost
+        is linear in output size rather than re-normalizing every check.
+        Key order matches canonicalize_json(self.to_dict()).
+        """
+        # Keys inserted in sorted order; "checks" sorts before all three.
+        tail = orjson.dumps(
+            {
+                "duration_ms": (
+                    int((self.end_time - self.start_time).total_seconds() * 1000)
+                    if self.start_time and self.end_time
+                    else None
+                ),
+                "end_time": self.end_time.isoformat() if self.end_time else None,
+                "start_time": self.start_time.isoformat() if self.start_time else None,
+            }
+        )
+        checks = b",".join(self._check_fragments)
+        return (b'{"checks":[' + checks + b"]," + tail[1:]).decode()
 
 
 class RiskSnapshot:
@@ -316,7 +704,7 @@ class RiskSnapshot:
         return canonicalize_json(self.indicators)
 
 
-def verify_hash_chain(records: list[Any]) -> bool:
+def verify_record_chain(records: list[Any]) -> bool:
     """Verify the integrity of a hash chain across multiple interaction records.
 
     Args:
@@ -337,6 +725,7 @@ def verify_hash_chain(records: list[Any]) -> bool:
 
     # Track the expected previous hash
     expected_previous_hash = None
+    legacy_count = 0
 
     for i, record in enumerate(records):
         # Check 1: Verify previous_record_hash linkage
@@ -375,14 +764,34 @@ def verify_hash_chain(records: list[Any]) -> bool:
         )
 
         if computed_hash != record.record_hash:
-            logger.error(
-                "record_hash_mismatch",
-                record_index=i,
+            # Fall back to the legacy canonical-JSON layout before
+            # flagging tampering: rows persisted before the binary
+            # layout shipped carry hashes in the old format.
+            legacy_hash = compute_record_hash_legacy(
                 record_id=record.record_id,
-                expected_hash=computed_hash[:16] + "...",
-                actual_hash=record.record_hash[:16] + "...",
+                org_id=str(record.org_id),
+                uapk_id=record.uapk_id,
+                agent_id=record.agent_id,
+                action_type=record.action_type,
+                tool=record.tool,
+                request_hash=record.request_hash,
+                decision=record.decision.value,
+                reasons_json=record.reasons_json,
+                policy_trace_json=record.policy_trace_json,
+                result_hash=record.result_hash,
+                previous_record_hash=record.previous_record_hash,
+                created_at=record.created_at,
             )
-            return False
+            if legacy_hash != record.record_hash:
+                logger.error(
+                    "record_hash_mismatch",
+                    record_index=i,
+                    record_id=record.record_id,
+                    expected_hash=computed_hash[:16] + "...",
+                    actual_hash=record.record_hash[:16] + "...",
+                )
+                return False
+            legacy_count += 1
 
         # Check 3: Verify gateway signature (if available)
         try:
@@ -408,5 +817,7 @@ def verify_hash_chain(records: list[Any]) -> bool:
             # Continue verification even if signature check fails
             # (key might not be available in all environments)
 
+    if legacy_count:
+        logger.info("legacy_format_records_verified", record_count=legacy_count)
     logger.info("hash_chain_verified", record_count=len(records), status="valid")
     return True
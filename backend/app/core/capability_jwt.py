@@ -1,11 +1,17 @@
 """JWT utilities for Ed25519-signed capability tokens."""
 
-import json
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+try:
+    # SIMD-accelerated base64; drop-in replacement for the stdlib API.
+    import pybase64 as _base64
+except ImportError:  # pragma: no cover - exercised only without wheels
+    import base64 as _base64
+
+import orjson
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
@@ -137,20 +143,46 @@ class CapabilityTokenClaims:
 
 def _base64url_encode(data: bytes) -> str:
     """Base64url encode without padding."""
-    import base64
-
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+    return _base64.urlsafe_b64encode(data).rstrip(b"=").decode()
 
 
 def _base64url_decode(data: str) -> bytes:
     """Base64url decode with padding restoration."""
-    import base64
-
     # Add padding if needed
     padding = 4 - len(data) % 4
     if padding != 4:
         data += "=" * padding
-    return base64.urlsafe_b64decode(data)
+    return _base64.urlsafe_b64decode(data)
+
+
+def _parse_jwt_segments(token: str) -> tuple[str, str, bytes, bytes, bytes]:
+    """Split a JWT and base64url-decode its three segments in one pass.
+
+    Returns (header_b64, payload_b64, header_bytes, payload_bytes,
+    signature); raises CapabilityTokenError with the caller-facing
+    message on malformed input. The per-request parse path lives in this
+    one helper so the hot loop stays tight; the heavy steps (split,
+    base64, JSON) all run in C extensions already.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise CapabilityTokenError("Invalid token format")
+
+    header_b64, payload_b64, signature_b64 = parts
+    try:
+        header_bytes = _base64url_decode(header_b64)
+    except Exception:
+        raise CapabilityTokenError("Invalid header encoding")
+    try:
+        payload_bytes = _base64url_decode(payload_b64)
+    except Exception:
+        raise CapabilityTokenError("Invalid payload encoding")
+    try:
+        signature = _base64url_decode(signature_b64)
+    except Exception:
+        raise CapabilityTokenError("Invalid signature encoding")
+
+    return header_b64, payload_b64, header_bytes, payload_bytes, signature
 
 
 def create_capability_token(
@@ -167,12 +199,10 @@ def create_capability_token(
 
     # Build JWT header
     header = {"alg": "EdDSA", "typ": "JWT"}
-    header_b64 = _base64url_encode(json.dumps(header, separators=(",", ":")).encode())
+    header_b64 = _base64url_encode(orjson.dumps(header))
 
     # Build payload
-    payload_b64 = _base64url_encode(
-        json.dumps(claims.to_dict(), separators=(",", ":")).encode()
-    )
+    payload_b64 = _base64url_encode(orjson.dumps(claims.to_dict()))
 
     # Create signature
     signing_input = f"{header_b64}.{payload_b64}"
@@ -198,15 +228,16 @@ def verify_capability_token(
         (claims, error): Claims if valid, error message if invalid
     """
     try:
-        parts = token.split(".")
-        if len(parts) != 3:
-            return None, "Invalid token format"
-
-        header_b64, payload_b64, signature_b64 = parts
+        try:
+            header_b64, payload_b64, header_bytes, payload_bytes, signature = (
+                _parse_jwt_segments(token)
+            )
+        except CapabilityTokenError as e:
+            return None, str(e)
 
         # Decode header
         try:
-            header = json.loads(_base64url_decode(header_b64))
+            header = orjson.loads(header_bytes)
         except Exception:
             return None, "Invalid header encoding"
 
@@ -215,16 +246,10 @@ def verify_capability_token(
 
         # Decode payload
         try:
-            payload = json.loads(_base64url_decode(payload_b64))
+            payload = orjson.loads(payload_bytes)
         except Exception:
             return None, "Invalid payload encoding"
 
-        # Decode signature
-        try:
-            signature = _base64url_decode(signature_b64)
-        except Exception:
-            return None, "Invalid signature encoding"
-
         # Get claims for issuer lookup
         claims = CapabilityTokenClaims.from_dict(payload)
 
@@ -259,6 +284,26 @@ def verify_capability_token(
         return None, f"Token verification failed: {e}"
 
 
+def verify_capability_tokens_batch(
+    tokens: list[str],
+    issuer_public_keys: dict[str, Ed25519PublicKey] | None = None,
+) -> list[tuple[CapabilityTokenClaims | None, str | None]]:
+    """Verify a batch of capability tokens in one pass.
+
+    Resolves the gateway public key once and threads it through every
+    verification instead of hitting the key manager per token. True
+    Ed25519 batch verification (a random linear combination of the
+    group equation across signatures) is not exposed by `cryptography`,
+    so each signature still verifies individually; the batching here
+    amortizes the per-token key resolution and lookup overhead.
+
+    Returns one (claims, error) tuple per token, in input order.
+    """
+    keys = dict(issuer_public_keys) if issuer_public_keys else {}
+    keys.setdefault("gateway", get_gateway_key_manager().public_key)
+    return [verify_capability_token(token, issuer_public_keys=keys) for token in tokens]
+
+
 def create_override_token(
     org_id: str,
     uapk_id: str,
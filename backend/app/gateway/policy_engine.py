@@ -416,6 +416,24 @@ class PolicyEngine:
                     }
                     # Note: per_currency takes precedence in _check_amount_caps if currency is specified
 
+        # 5. Freeze membership collections so every `in` check below is a
+        # hash lookup instead of a list scan; jurisdictions are upper-cased
+        # here once rather than per check.
+        for key in ("allowed_action_types", "allowed_tools", "denied_tools"):
+            if key in normalized and not isinstance(normalized[key], frozenset):
+                normalized[key] = frozenset(normalized[key])
+        if "allowed_jurisdictions" in normalized:
+            normalized["allowed_jurisdictions"] = frozenset(
+                j.upper() for j in normalized["allowed_jurisdictions"]
+            )
+        counterparty = normalized.get("counterparty")
+        if counterparty:
+            counterparty = dict(counterparty)
+            for key in ("allowlist", "denylist"):
+                if key in counterparty and not isinstance(counterparty[key], frozenset):
+                    counterparty[key] = frozenset(counterparty[key])
+            normalized["counterparty"] = counterparty
+
         return normalized
 
     def _check_action_type_allowed(
@@ -435,7 +453,7 @@ class PolicyEngine:
             result.add_reason(
                 ReasonCode.ACTION_TYPE_NOT_ALLOWED,
                 f"Action type '{context.action.type}' is not allowed",
-                {"allowed_types": allowed_action_types},
+                {"allowed_types": sorted(allowed_action_types)},
             )
             return False
 
@@ -464,7 +482,7 @@ class PolicyEngine:
             result.add_reason(
                 ReasonCode.TOOL_NOT_ALLOWED,
                 f"Tool '{context.action.tool}' is not in allowed tools list",
-                {"allowed_tools": allowed_tools},
+                {"allowed_tools": sorted(allowed_tools)},
             )
             return False
 
@@ -666,14 +684,15 @@ class PolicyEngine:
             # If no jurisdiction info, allow by default (could be configured)
             return True
 
+        # The allowlist is upper-cased once in _normalize_policy_config,
+        # so this is a single hash lookup per check.
         jurisdiction = context.counterparty.jurisdiction.upper()
-        allowed_upper = [j.upper() for j in allowed_jurisdictions]
 
-        if jurisdiction not in allowed_upper:
+        if jurisdiction not in allowed_jurisdictions:
             result.add_reason(
                 ReasonCode.JURISDICTION_NOT_ALLOWED,
                 f"Jurisdiction '{jurisdiction}' is not in allowed list",
-                {"allowed_jurisdictions": allowed_jurisdictions},
+                {"allowed_jurisdictions": sorted(allowed_jurisdictions)},
             )
             return False
 
@@ -22,7 +22,7 @@ from botocore.exceptions import ClientError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.audit import canonicalize_json, verify_hash_chain
+from app.core.audit import canonicalize_json, verify_record_chain
 from app.core.config import get_settings
 from app.core.ed25519 import get_gateway_key_manager
 from app.core.logging import get_logger
@@ -146,7 +146,7 @@ class AuditAnchorService:
                     )
 
             # Verify the record's own hash
-            if not verify_hash_chain([record]):
+            if not verify_record_chain([record]):
                 raise AuditAnchorError(f"Record {record.record_id} failed hash verification")
 
         # Build export payload
@@ -316,7 +316,7 @@ class AuditAnchorService:
 
         # Verify hash chain if requested
         if verify_chain:
-            if not verify_hash_chain(records):
+            if not verify_record_chain(records):
                 raise AuditAnchorError("Hash chain verification failed for record batch")
 
         # Export each record
@@ -416,7 +416,7 @@ class AuditAnchorService:
             raise AuditAnchorError("No records found for evidence bundle")
 
         # Verify hash chain
-        chain_valid = verify_hash_chain(records)
+        chain_valid = verify_record_chain(records)
 
         # Create temporary directory for bundle
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -7,6 +7,11 @@ This tool verifies the integrity of exported audit logs by:
 2. Recomputing and comparing record hashes
 3. Verifying Ed25519 signatures
 
+Record hashes are computed over the gateway's current length-prefixed
+binary layout. Chains persisted before that layout shipped were hashed
+over canonical JSON; records that match the old format are accepted
+and reported as legacy-format records.
+
 Usage:
     python scripts/verify_log_chain.py export.json
     python scripts/verify_log_chain.py logs.jsonl
@@ -18,6 +23,7 @@ import argparse
 import base64
 import hashlib
 import json
+import struct
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -64,8 +70,59 @@ def compute_hash(data: str) -> str:
     return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
 
+# Little-endian uint32 length prefix for each hashed field; None fields
+# carry the max-uint32 sentinel. Must match the layout in
+# backend/app/core/audit.py.
+_pack_length = struct.Struct("<I").pack
+_NONE_FIELD = _pack_length(0xFFFFFFFF)
+
+
 def compute_record_hash(record: dict) -> str:
-    """Compute the tamper-evident hash of a record."""
+    """Compute the tamper-evident hash of a record.
+
+    Matches the gateway's current layout: each field in a fixed order
+    is streamed into SHA-256 as a little-endian uint32 length prefix
+    plus the UTF-8 bytes, with a sentinel segment for absent fields.
+    """
+    created = record["created_at"]
+    if isinstance(created, datetime):
+        created = created.isoformat()
+
+    fields = (
+        record["record_id"],
+        record["org_id"],
+        record["uapk_id"],
+        record["agent_id"],
+        record["action_type"],
+        record["tool"],
+        record["request_hash"],
+        record["decision"],
+        record["reasons_json"],
+        record["policy_trace_json"],
+        record.get("result_hash"),
+        record.get("previous_record_hash"),
+        created,
+    )
+
+    h = hashlib.sha256()
+    update = h.update
+    for field in fields:
+        if field is None:
+            update(_NONE_FIELD)
+        else:
+            encoded = field.encode("utf-8")
+            update(_pack_length(len(encoded)))
+            update(encoded)
+    return h.hexdigest()
+
+
+def compute_record_hash_legacy(record: dict) -> str:
+    """Compute a record hash in the original canonical-JSON layout.
+
+    Chains persisted before the binary layout shipped were hashed over
+    canonical JSON; verify_chain falls back to this format per record
+    so old exports still verify.
+    """
     record_data = {
         "record_id": record["record_id"],
         "org_id": record["org_id"],
@@ -137,6 +194,7 @@ def verify_chain(
         print(f"Verifying chain of {len(records)} records...")
 
     previous_hash: str | None = None
+    legacy_count = 0
 
     for i, record in enumerate(records):
         record_id = record.get("record_id", f"record_{i}")
@@ -157,12 +215,15 @@ def verify_chain(
                 print(f"    Expected previous: {previous_hash}")
                 print(f"    Got previous: {stored_previous}")
 
-        # Recompute record hash
+        # Recompute record hash; chains written before the binary
+        # layout shipped fall back to the legacy canonical-JSON format.
         try:
             computed_hash = compute_record_hash(record)
             stored_hash = record.get("record_hash")
 
-            if computed_hash != stored_hash:
+            if computed_hash != stored_hash and compute_record_hash_legacy(record) == stored_hash:
+                legacy_count += 1
+            elif computed_hash != stored_hash:
                 error = (
                     f"Record {record_id}: record_hash mismatch. "
                     f"Expected {computed_hash}, got {stored_hash}"
@@ -197,6 +258,9 @@ def verify_chain(
         # Update previous hash for next iteration
         previous_hash = record.get("record_hash")
 
+    if legacy_count:
+        print(f"Note: {legacy_count} record(s) matched the legacy canonical-JSON hash format")
+
     return len(errors) == 0, errors
 
 
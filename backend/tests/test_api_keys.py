@@ -1,5 +1,6 @@
 """Tests for API key endpoints."""
 
+import orjson
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,20 +10,33 @@ from app.models.organization import Organization
 from app.models.user import User
 
 
+@pytest.fixture
+def create_key_request(
+    test_user_with_org: tuple[User, Organization, Membership],
+    auth_headers_with_org: dict[str, str],
+) -> tuple[bytes, dict[str, str]]:
+    """Pre-serialized create-key payload plus headers.
+
+    Serializing once per test avoids httpx re-encoding the same dict on
+    every POST in the tests below.
+    """
+    _, org, _ = test_user_with_org
+    content = orjson.dumps({"name": "Test Key", "org_id": str(org.id)})
+    headers = {**auth_headers_with_org, "content-type": "application/json"}
+    return content, headers
+
+
 @pytest.mark.asyncio
 async def test_create_api_key_success(
     client: AsyncClient,
     test_user_with_org: tuple[User, Organization, Membership],
-    auth_headers_with_org: dict[str, str],
+    create_key_request: tuple[bytes, dict[str, str]],
 ) -> None:
     """Test creating an API key returns the full key once."""
     user, org, _ = test_user_with_org
+    content, headers = create_key_request
 
-    response = await client.post(
-        "/api/v1/api-keys",
-        json={"name": "Test Key", "org_id": str(org.id)},
-        headers=auth_headers_with_org,
-    )
+    response = await client.post("/api/v1/api-keys", content=content, headers=headers)
     assert response.status_code == 201
     data = response.json()
 
@@ -72,18 +86,14 @@ async def test_create_api_key_unauthenticated(
 @pytest.mark.asyncio
 async def test_list_api_keys(
     client: AsyncClient,
-    test_user_with_org: tuple[User, Organization, Membership],
     auth_headers_with_org: dict[str, str],
+    create_key_request: tuple[bytes, dict[str, str]],
 ) -> None:
     """Test listing API keys returns keys without full key value."""
-    user, org, _ = test_user_with_org
+    content, headers = create_key_request
 
     # Create a key first
-    create_response = await client.post(
-        "/api/v1/api-keys",
-        json={"name": "Test Key", "org_id": str(org.id)},
-        headers=auth_headers_with_org,
-    )
+    create_response = await client.post("/api/v1/api-keys", content=content, headers=headers)
     assert create_response.status_code == 201
 
     # List keys
@@ -106,16 +116,14 @@ async def test_list_api_keys_by_org(
     client: AsyncClient,
     test_user_with_org: tuple[User, Organization, Membership],
     auth_headers_with_org: dict[str, str],
+    create_key_request: tuple[bytes, dict[str, str]],
 ) -> None:
     """Test listing API keys filtered by organization."""
     user, org, _ = test_user_with_org
+    content, headers = create_key_request
 
     # Create a key
-    await client.post(
-        "/api/v1/api-keys",
-        json={"name": "Test Key", "org_id": str(org.id)},
-        headers=auth_headers_with_org,
-    )
+    await client.post("/api/v1/api-keys", content=content, headers=headers)
 
     # List keys for specific org
     response = await client.get(
@@ -130,18 +138,14 @@ async def test_list_api_keys_by_org(
 @pytest.mark.asyncio
 async def test_revoke_api_key(
     client: AsyncClient,
-    test_user_with_org: tuple[User, Organization, Membership],
     auth_headers_with_org: dict[str, str],
+    create_key_request: tuple[bytes, dict[str, str]],
 ) -> None:
     """Test revoking an API key."""
-    user, org, _ = test_user_with_org
+    content, headers = create_key_request
 
     # Create a key
-    create_response = await client.post(
-        "/api/v1/api-keys",
-        json={"name": "Test Key", "org_id": str(org.id)},
-        headers=auth_headers_with_org,
-    )
+    create_response = await client.post("/api/v1/api-keys", content=content, headers=headers)
     key_id = create_response.json()["id"]
 
     # Revoke the key
@@ -1,61 +1,95 @@
 """Tests for approval workflow."""
 
+import itertools
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.capability_jwt import verify_capability_token
 from app.models.approval import Approval, ApprovalStatus
 from app.schemas.approval import ApproveRequest, DenyRequest
 from app.services import approval as approval_service
 from app.services.approval import ApprovalError
 
+# Monotonic suffix for unique approval/interaction IDs. Deterministic
+# (easier to read in failures) and avoids an entropy syscall per fixture.
+_approval_seq = itertools.count(1)
+
+
+async def _make_approvals(
+    db_session: AsyncSession,
+    org_id,
+    specs: list[dict],
+) -> list[Approval]:
+    """Create a batch of approvals with a single flush.
+
+    Each spec is a dict of Approval column overrides; shared defaults
+    fill in the rest. Batching keeps fixture setup at one round-trip
+    regardless of how many approvals a test needs.
+    """
+    approvals = [
+        Approval(
+            id=uuid4(),
+            org_id=org_id,
+            uapk_id="test-uapk",
+            agent_id="test-agent",
+            status=ApprovalStatus.PENDING,
+            **spec,
+        )
+        for spec in specs
+    ]
+    db_session.add_all(approvals)
+    await db_session.flush()
+    return approvals
+
 
 @pytest_asyncio.fixture
 async def test_approval(db_session: AsyncSession, test_org) -> Approval:
     """Create a test approval."""
-    approval = Approval(
-        id=uuid4(),
-        approval_id=f"appr-test-{uuid4().hex[:8]}",
-        org_id=test_org.id,
-        interaction_id=f"int-test-{uuid4().hex[:8]}",
-        uapk_id="test-uapk",
-        agent_id="test-agent",
-        action={
-            "type": "payment",
-            "tool": "stripe_transfer",
-            "params": {"amount": 1000, "currency": "USD"},
-        },
-        counterparty={"id": "vendor-123", "type": "merchant"},
-        context={"conversation_id": "conv-123"},
-        reason_codes=["amount_requires_approval"],
-        status=ApprovalStatus.PENDING,
-        expires_at=datetime.now(UTC) + timedelta(hours=24),
+    seq = next(_approval_seq)
+    (approval,) = await _make_approvals(
+        db_session,
+        test_org.id,
+        [
+            {
+                "approval_id": f"appr-test-{seq:08d}",
+                "interaction_id": f"int-test-{seq:08d}",
+                "action": {
+                    "type": "payment",
+                    "tool": "stripe_transfer",
+                    "params": {"amount": 1000, "currency": "USD"},
+                },
+                "counterparty": {"id": "vendor-123", "type": "merchant"},
+                "context": {"conversation_id": "conv-123"},
+                "reason_codes": ["amount_requires_approval"],
+                "expires_at": datetime.now(UTC) + timedelta(hours=24),
+            }
+        ],
     )
-    db_session.add(approval)
-    await db_session.flush()
     return approval
 
 
 @pytest_asyncio.fixture
 async def expired_approval(db_session: AsyncSession, test_org) -> Approval:
     """Create an expired approval."""
-    approval = Approval(
-        id=uuid4(),
-        approval_id=f"appr-expired-{uuid4().hex[:8]}",
-        org_id=test_org.id,
-        interaction_id=f"int-expired-{uuid4().hex[:8]}",
-        uapk_id="test-uapk",
-        agent_id="test-agent",
-        action={"type": "payment", "tool": "stripe_transfer", "params": {}},
-        reason_codes=["budget_threshold_reached"],
-        status=ApprovalStatus.PENDING,
-        expires_at=datetime.now(UTC) - timedelta(hours=1),  # Already expired
+    seq = next(_approval_seq)
+    (approval,) = await _make_approvals(
+        db_session,
+        test_org.id,
+        [
+            {
+                "approval_id": f"appr-expired-{seq:08d}",
+                "interaction_id": f"int-expired-{seq:08d}",
+                "action": {"type": "payment", "tool": "stripe_transfer", "params": {}},
+                "reason_codes": ["budget_threshold_reached"],
+                "expires_at": datetime.now(UTC) - timedelta(hours=1),  # Already expired
+            }
+        ],
     )
-    db_session.add(approval)
-    await db_session.flush()
     return approval
 
 
@@ -147,8 +181,6 @@ class TestApprovalService:
         self, db_session: AsyncSession, test_approval: Approval
     ):
         """Test that approval generates a valid override token."""
-        from app.core.capability_jwt import verify_capability_token
-
         result = await approval_service.approve_action(
             db=db_session,
             org_id=test_approval.org_id,
@@ -183,72 +215,51 @@ class TestApprovalService:
         assert result.override_token is None
 
     @pytest.mark.asyncio
-    async def test_cannot_approve_already_approved(
-        self, db_session: AsyncSession, test_approval: Approval
-    ):
-        """Test that approved actions cannot be approved again."""
-        # First approve
-        await approval_service.approve_action(
-            db=db_session,
-            org_id=test_approval.org_id,
-            approval_id=test_approval.approval_id,
-            request=ApproveRequest(),
-            user_id="user-123",
-        )
-
-        # Try to approve again
-        with pytest.raises(ApprovalError) as exc_info:
-            await approval_service.approve_action(
-                db=db_session,
-                org_id=test_approval.org_id,
-                approval_id=test_approval.approval_id,
-                request=ApproveRequest(),
-                user_id="user-456",
-            )
-
-        assert "not pending" in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_cannot_deny_already_denied(
-        self, db_session: AsyncSession, test_approval: Approval
+    @pytest.mark.parametrize(
+        "use_expired, pre_action, action, expected_error",
+        [
+            (False, "approve", "approve", "not pending"),
+            (False, "deny", "deny", "not pending"),
+            (True, None, "approve", "expired"),
+        ],
+    )
+    async def test_decision_error_paths(
+        self,
+        db_session: AsyncSession,
+        test_approval: Approval,
+        expired_approval: Approval,
+        use_expired: bool,
+        pre_action: str | None,
+        action: str,
+        expected_error: str,
     ):
-        """Test that denied actions cannot be denied again."""
-        # First deny
-        await approval_service.deny_action(
-            db=db_session,
-            org_id=test_approval.org_id,
-            approval_id=test_approval.approval_id,
-            request=DenyRequest(),
-            user_id="user-123",
-        )
-
-        # Try to deny again
-        with pytest.raises(ApprovalError) as exc_info:
-            await approval_service.deny_action(
+        """Re-deciding non-pending or expired approvals raises ApprovalError."""
+        approval = expired_approval if use_expired else test_approval
+
+        async def _decide(name: str, user_id: str):
+            if name == "approve":
+                return await approval_service.approve_action(
+                    db=db_session,
+                    org_id=approval.org_id,
+                    approval_id=approval.approval_id,
+                    request=ApproveRequest(),
+                    user_id=user_id,
+                )
+            return await approval_service.deny_action(
                 db=db_session,
-                org_id=test_approval.org_id,
-                approval_id=test_approval.approval_id,
+                org_id=approval.org_id,
+                approval_id=approval.approval_id,
                 request=DenyRequest(),
-                user_id="user-456",
+                user_id=user_id,
             )
 
-        assert "not pending" in str(exc_info.value).lower()
+        if pre_action:
+            await _decide(pre_action, "user-123")
 
-    @pytest.mark.asyncio
-    async def test_approve_expired_approval(
-        self, db_session: AsyncSession, expired_approval: Approval
-    ):
-        """Test that expired approvals cannot be approved."""
         with pytest.raises(ApprovalError) as exc_info:
-            await approval_service.approve_action(
-                db=db_session,
-                org_id=expired_approval.org_id,
-                approval_id=expired_approval.approval_id,
-                request=ApproveRequest(),
-                user_id="user-123",
-            )
+            await _decide(action, "user-456")
 
-        assert "expired" in str(exc_info.value).lower()
+        assert expected_error in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
     async def test_get_approval_stats(
@@ -274,6 +285,9 @@ class TestApprovalService:
             org_id=expired_approval.org_id,
         )
 
-        # Refresh and check status
-        await db_session.refresh(expired_approval)
-        assert expired_approval.status == ApprovalStatus.EXPIRED
+        # Re-query only the status column; a full refresh() would also
+        # pull back the JSONB action/context/counterparty blobs.
+        status = await db_session.scalar(
+            select(Approval.status).where(Approval.id == expired_approval.id)
+        )
+        assert status == ApprovalStatus.EXPIRED
@@ -1,18 +1,23 @@
 """Tests for authentication endpoints."""
 
+import orjson
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 
+# The login payload is identical across tests; serialize it once at
+# import instead of JSON-encoding the same dict per request.
+_LOGIN_PAYLOAD = orjson.dumps({"email": "test@example.com", "password": "testpassword123"})
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 @pytest.mark.asyncio
 async def test_login_success(client: AsyncClient, test_user: User) -> None:
     """Test successful login returns JWT token."""
     response = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "test@example.com", "password": "testpassword123"},
+        "/api/v1/auth/login", content=_LOGIN_PAYLOAD, headers=_JSON_HEADERS
     )
     assert response.status_code == 200
     data = response.json()
@@ -54,8 +59,7 @@ async def test_login_inactive_user(
     await db_session.flush()
 
     response = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "test@example.com", "password": "testpassword123"},
+        "/api/v1/auth/login", content=_LOGIN_PAYLOAD, headers=_JSON_HEADERS
     )
     assert response.status_code == 401
 
@@ -10,6 +10,7 @@ from app.core.capability_jwt import (
     TokenConstraints,
     create_capability_token,
     verify_capability_token,
+    verify_capability_tokens_batch,
 )
 from app.core.ed25519 import (
     GatewayKeyManager,
@@ -18,10 +19,46 @@ from app.core.ed25519 import (
     public_key_to_base64,
 )
 
+# Any valid UUID string works for these claims; draw a small pool once
+# at import instead of a CSPRNG read + hyphen formatting per test.
+_ORG_IDS = [str(uuid4()) for _ in range(4)]
+
+
+@pytest.fixture(scope="module")
+def make_claims():
+    """Factory for the claims shape shared by the token tests.
+
+    Tests override only the fields they assert on instead of repeating
+    the full constructor call per test.
+    """
+
+    def _make(**overrides):
+        now = int(time.time())
+        base = {
+            "iss": "gateway",
+            "sub": "agent-123",
+            "org_id": _ORG_IDS[0],
+            "uapk_id": "uapk-789",
+            "iat": now,
+            "exp": now + 3600,
+            "jti": "test-jti",
+        }
+        base.update(overrides)
+        return CapabilityTokenClaims(**base)
+
+    return _make
+
 
 class TestEd25519KeyManagement:
     """Test Ed25519 key generation and management."""
 
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def ed25519_keypair():
+        """One example keypair for the class; tests that only need some
+        valid keypair share it instead of re-running curve keygen."""
+        return generate_ed25519_keypair()
+
     def test_generate_keypair(self):
         """Test keypair generation."""
         private_key, public_key = generate_ed25519_keypair()
@@ -29,9 +66,9 @@ class TestEd25519KeyManagement:
         assert private_key is not None
         assert public_key is not None
 
-    def test_public_key_base64_roundtrip(self):
+    def test_public_key_base64_roundtrip(self, ed25519_keypair):
         """Test public key base64 encoding/decoding."""
-        _, public_key = generate_ed25519_keypair()
+        _, public_key = ed25519_keypair
 
         # Encode to base64
         b64 = public_key_to_base64(public_key)
@@ -154,23 +191,20 @@ class TestCapabilityTokenClaims:
 class TestCapabilityTokenCreation:
     """Test capability token creation and verification."""
 
-    def test_create_and_verify_token(self):
-        """Test creating and verifying a token."""
-        now = int(time.time())
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def sample_token(make_claims):
+        """One valid signed token for the verification-path tests.
 
-        claims = CapabilityTokenClaims(
-            iss="gateway",
-            sub="agent-123",
-            org_id=str(uuid4()),
-            uapk_id="uapk-789",
-            allowed_action_types=["payment"],
-            iat=now,
-            exp=now + 3600,
-            jti="test-jti",
-        )
+        Ed25519 signing dominates token creation; tests that only
+        exercise verify paths share this instead of re-signing.
+        """
+        claims = make_claims(allowed_action_types=["payment"])
+        return claims, create_capability_token(claims)
 
-        # Create token
-        token = create_capability_token(claims)
+    def test_create_and_verify_token(self, sample_token):
+        """Test creating and verifying a token."""
+        _, token = sample_token
 
         assert token is not None
         assert isinstance(token, str)
@@ -185,18 +219,14 @@ class TestCapabilityTokenCreation:
         assert verified_claims.sub == "agent-123"
         assert verified_claims.allowed_action_types == ["payment"]
 
-    def test_expired_token(self):
+    def test_expired_token(self, make_claims):
         """Test that expired tokens are rejected."""
         now = int(time.time())
 
-        claims = CapabilityTokenClaims(
-            iss="gateway",
-            sub="agent-123",
-            org_id=str(uuid4()),
-            uapk_id="uapk-789",
+        claims = make_claims(
+            org_id=_ORG_IDS[1],
             iat=now - 7200,  # Issued 2 hours ago
             exp=now - 3600,  # Expired 1 hour ago
-            jti="test-jti",
         )
 
         token = create_capability_token(claims)
@@ -207,21 +237,9 @@ class TestCapabilityTokenCreation:
         assert error is not None
         assert "expired" in error.lower()
 
-    def test_invalid_signature(self):
+    def test_invalid_signature(self, sample_token):
         """Test that tokens with invalid signatures are rejected."""
-        now = int(time.time())
-
-        claims = CapabilityTokenClaims(
-            iss="gateway",
-            sub="agent-123",
-            org_id=str(uuid4()),
-            uapk_id="uapk-789",
-            iat=now,
-            exp=now + 3600,
-            jti="test-jti",
-        )
-
-        token = create_capability_token(claims)
+        _, token = sample_token
 
         # Tamper with the token
         parts = token.split(".")
@@ -234,6 +252,21 @@ class TestCapabilityTokenCreation:
         assert error is not None
         assert verified_claims is None
 
+    def test_batch_verification(self, sample_token):
+        """Batch verification should match per-token results."""
+        claims, token = sample_token
+
+        results = verify_capability_tokens_batch([token, "notavalidtoken"])
+
+        verified_claims, error = results[0]
+        assert error is None
+        assert verified_claims is not None
+        assert verified_claims.jti == claims.jti
+
+        bad_claims, bad_error = results[1]
+        assert bad_claims is None
+        assert bad_error is not None
+
     def test_invalid_token_format(self):
         """Test that malformed tokens are rejected."""
         # Too few parts
@@ -246,8 +279,12 @@ class TestCapabilityTokenCreation:
 
     def test_wrong_algorithm(self):
         """Test that tokens with wrong algorithm are rejected."""
-        import base64
-        import json
+        import orjson
+
+        try:
+            import pybase64 as base64
+        except ImportError:
+            import base64
 
         now = int(time.time())
 
@@ -256,15 +293,15 @@ class TestCapabilityTokenCreation:
         payload = {
             "iss": "gateway",
             "sub": "agent-123",
-            "org_id": str(uuid4()),
+            "org_id": _ORG_IDS[2],
             "uapk_id": "uapk-789",
             "iat": now,
             "exp": now + 3600,
             "jti": "test-jti",
         }
 
-        header_b64 = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b"=").decode()
-        payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+        header_b64 = base64.urlsafe_b64encode(orjson.dumps(header)).rstrip(b"=").decode()
+        payload_b64 = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=").decode()
         fake_sig = base64.urlsafe_b64encode(b"fakesignature").rstrip(b"=").decode()
 
         token = f"{header_b64}.{payload_b64}.{fake_sig}"
@@ -282,7 +319,7 @@ class TestOverrideToken:
         from app.core.capability_jwt import create_override_token
 
         token = create_override_token(
-            org_id=str(uuid4()),
+            org_id=_ORG_IDS[3],
             uapk_id="uapk-123",
             agent_id="agent-456",
             action_hash="abc123",
@@ -1,9 +1,11 @@
 """Tests for the Agent Interaction Gateway."""
 
-import pytest
-from datetime import UTC, datetime
+import time
+from typing import ClassVar
 from uuid import uuid4
 
+import pytest
+
 from app.gateway.connectors import ConnectorConfig, MockConnector
 from app.gateway.policy_engine import PolicyContext, PolicyEngine
 from app.schemas.gateway import (
@@ -14,6 +16,10 @@ from app.schemas.gateway import (
     ReasonCode,
 )
 
+# Any valid org UUID works for policy contexts; draw one at import
+# instead of a CSPRNG read per helper call.
+_ORG_ID = uuid4()
+
 
 class TestMockConnector:
     """Tests for the MockConnector."""
@@ -69,20 +75,29 @@ class TestMockConnector:
         assert result.error["message"] == "Simulated test failure"
 
     @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_mock_connector_with_delay(self):
-        """Test MockConnector with simulated delay."""
+        """Test MockConnector with simulated delay.
+
+        Sleeps ~50ms of real wall time; skip locally with
+        ``pytest -m "not slow"`` when iterating.
+        """
         config = ConnectorConfig(
             connector_type="mock",
             extra={"delay_ms": 50},
         )
         connector = MockConnector(config)
 
-        start = datetime.now(UTC)
+        # Monotonic integer clock: immune to wall-clock steps and no
+        # datetime allocation around the timed section.
+        start = time.monotonic_ns()
         result = await connector.execute({})
-        duration = (datetime.now(UTC) - start).total_seconds() * 1000
+        duration = (time.monotonic_ns() - start) / 1e6
 
         assert result.success is True
-        assert duration >= 50  # Should have delayed at least 50ms
+        # Event-loop timers can fire up to ~1ms early; allow for that
+        # rather than flaking on scheduler granularity.
+        assert duration >= 49  # Should have delayed about 50ms
 
 
 class TestPolicyEngine:
@@ -97,7 +112,7 @@ class TestPolicyEngine:
     ) -> PolicyContext:
         """Helper to create a policy context."""
         return PolicyContext(
-            org_id=uuid4(),
+            org_id=_ORG_ID,
             uapk_id="test-agent",
             agent_id="agent-instance-1",
             action=ActionInfo(
@@ -157,62 +172,33 @@ class TestPolicyEngine:
 
         assert denied is True
 
-    def test_check_amount_caps_under_limit(self):
-        """Test amount check under limit."""
-        context = self._create_context(
-            params={"amount": 100, "currency": "USD"}
-        )
-        policy_config = {
-            "amount_caps": {
-                "param_paths": ["amount"],
-                "max_amount": 1000,
-                "escalate_above": 500,
-            }
+    # Shared cap config for the amount sweep below; hoisted so the
+    # parametrized cases only vary the amount under test.
+    _AMOUNT_CAPS_CONFIG: ClassVar[dict] = {
+        "amount_caps": {
+            "param_paths": ["amount"],
+            "max_amount": 1000,
+            "escalate_above": 500,
         }
-
-        amount = context.action.params.get("amount")
-        max_amount = policy_config["amount_caps"]["max_amount"]
-        escalate_above = policy_config["amount_caps"]["escalate_above"]
-
-        assert amount < max_amount
-        assert amount < escalate_above
-
-    def test_check_amount_caps_exceeds_limit(self):
-        """Test amount check exceeds limit."""
-        context = self._create_context(
-            params={"amount": 1500, "currency": "USD"}
-        )
-        policy_config = {
-            "amount_caps": {
-                "param_paths": ["amount"],
-                "max_amount": 1000,
-            }
-        }
-
-        amount = context.action.params.get("amount")
-        max_amount = policy_config["amount_caps"]["max_amount"]
-
-        assert amount > max_amount
-
-    def test_check_amount_caps_escalate(self):
-        """Test amount check triggers escalation."""
-        context = self._create_context(
-            params={"amount": 600, "currency": "USD"}
-        )
-        policy_config = {
-            "amount_caps": {
-                "param_paths": ["amount"],
-                "max_amount": 1000,
-                "escalate_above": 500,
-            }
-        }
-
-        amount = context.action.params.get("amount")
-        escalate_above = policy_config["amount_caps"]["escalate_above"]
-        max_amount = policy_config["amount_caps"]["max_amount"]
-
-        assert amount > escalate_above
-        assert amount < max_amount
+    }
+
+    @pytest.mark.parametrize(
+        "amount, expect_over_cap, expect_escalate",
+        [
+            (100, False, False),  # under both thresholds
+            (1500, True, False),  # over the hard cap
+            (600, False, True),  # between escalation threshold and cap
+        ],
+    )
+    def test_check_amount_caps(self, amount, expect_over_cap, expect_escalate):
+        """Test amount checks against cap and escalation thresholds."""
+        context = self._create_context(params={"amount": amount, "currency": "USD"})
+        caps = self._AMOUNT_CAPS_CONFIG["amount_caps"]
+
+        actual = context.action.params.get("amount")
+
+        assert (actual > caps["max_amount"]) is expect_over_cap
+        assert (caps["escalate_above"] < actual <= caps["max_amount"]) is expect_escalate
 
     def test_check_jurisdiction_allowed(self):
         """Test jurisdiction check with allowlist."""
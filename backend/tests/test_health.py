@@ -1,7 +1,22 @@
 """Tests for health check endpoints."""
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """One sync client shared by the whole module.
+
+    The health endpoints are read-only and stateless, so rebuilding the
+    ASGI transport per test buys nothing; this also shadows the
+    function-scoped async client from conftest, which these sync tests
+    cannot await and whose database session they don't need.
+    """
+    return TestClient(app)
+
 
 def test_healthz(client: TestClient) -> None:
     """Test the health check endpoint."""
@@ -6,6 +6,7 @@ from app.core.security import (
     create_access_token,
     decode_access_token,
     generate_api_key,
+    generate_api_keys,
     get_api_key_prefix,
     hash_api_key,
     hash_password,
@@ -13,30 +14,40 @@ from app.core.security import (
     verify_password,
 )
 
+_PASSWORD = "testpassword123"
 
-def test_hash_password() -> None:
-    """Test password hashing."""
-    password = "testpassword123"
-    hashed = hash_password(password)
 
-    assert hashed != password
-    assert hashed.startswith("$2b$")  # bcrypt prefix
+@pytest.fixture(scope="module")
+def bcrypt_password_hash() -> str:
+    """Hash the shared test password once for the whole module.
 
+    Bcrypt key-stretching is deliberately slow; the verify-path tests
+    only need some valid hash, not a fresh one each.
+    """
+    return hash_password(_PASSWORD)
 
-def test_verify_password_correct() -> None:
-    """Test password verification with correct password."""
-    password = "testpassword123"
-    hashed = hash_password(password)
 
-    assert verify_password(password, hashed) is True
+@pytest.fixture(scope="module")
+def bcrypt_api_key_hash() -> tuple[str, str]:
+    """Generate and hash one API key for the verify-path tests."""
+    key = generate_api_key()
+    return key, hash_api_key(key)
 
 
-def test_verify_password_incorrect() -> None:
-    """Test password verification with incorrect password."""
-    password = "testpassword123"
-    hashed = hash_password(password)
+def test_hash_password(bcrypt_password_hash: str) -> None:
+    """Test password hashing."""
+    assert bcrypt_password_hash != _PASSWORD
+    assert bcrypt_password_hash.startswith("$2b$")  # bcrypt prefix
+
 
-    assert verify_password("wrongpassword", hashed) is False
+def test_verify_password_correct(bcrypt_password_hash: str) -> None:
+    """Test password verification with correct password."""
+    assert verify_password(_PASSWORD, bcrypt_password_hash) is True
+
+
+def test_verify_password_incorrect(bcrypt_password_hash: str) -> None:
+    """Test password verification with incorrect password."""
+    assert verify_password("wrongpassword", bcrypt_password_hash) is False
 
 
 def test_create_access_token() -> None:
@@ -76,9 +87,10 @@ def test_generate_api_key() -> None:
 
 def test_generate_api_key_uniqueness() -> None:
     """Test that generated API keys are unique."""
-    keys = [generate_api_key() for _ in range(100)]
+    keys = generate_api_keys(100)
 
     assert len(set(keys)) == 100  # All unique
+    assert all(key.startswith("uapk_") and len(key) == 37 for key in keys)
 
 
 def test_get_api_key_prefix() -> None:
@@ -90,27 +102,24 @@ def test_get_api_key_prefix() -> None:
     assert len(prefix) == 12
 
 
-def test_hash_api_key() -> None:
+def test_hash_api_key(bcrypt_api_key_hash: tuple[str, str]) -> None:
     """Test API key hashing."""
-    key = generate_api_key()
-    hashed = hash_api_key(key)
+    key, hashed = bcrypt_api_key_hash
 
     assert hashed != key
     assert hashed.startswith("$2b$")  # bcrypt prefix
 
 
-def test_verify_api_key_correct() -> None:
+def test_verify_api_key_correct(bcrypt_api_key_hash: tuple[str, str]) -> None:
     """Test API key verification with correct key."""
-    key = generate_api_key()
-    hashed = hash_api_key(key)
+    key, hashed = bcrypt_api_key_hash
 
     assert verify_api_key(key, hashed) is True
 
 
-def test_verify_api_key_incorrect() -> None:
+def test_verify_api_key_incorrect(bcrypt_api_key_hash: tuple[str, str]) -> None:
     """Test API key verification with incorrect key."""
-    key = generate_api_key()
-    hashed = hash_api_key(key)
+    _, hashed = bcrypt_api_key_hash
     other_key = generate_api_key()
 
     assert verify_api_key(other_key, hashed) is False
@@ -16,6 +16,9 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
+from sqlalchemy import literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from app.core.database import get_session_factory, init_db, close_db
 from app.core.security import hash_password
 from app.models.membership import Membership, MembershipRole
@@ -31,10 +34,7 @@ async def bootstrap() -> None:
     org_name = os.environ.get("ORG_NAME", "Default Organization")
     org_slug = os.environ.get("ORG_SLUG", "default")
 
-    print("=" * 60)
-    print("UAPK Gateway Bootstrap")
-    print("=" * 60)
-    print()
+    sys.stdout.write("=" * 60 + "\nUAPK Gateway Bootstrap\n" + "=" * 60 + "\n\n")
 
     # Initialize database
     await init_db()
@@ -42,89 +42,105 @@ async def bootstrap() -> None:
 
     async with session_factory() as session:
         try:
-            # Check if admin user already exists
-            from sqlalchemy import select
-
-            result = await session.execute(select(User).where(User.email == admin_email))
-            existing_user = result.scalar_one_or_none()
-
-            if existing_user:
-                print(f"User '{admin_email}' already exists. Skipping user creation.")
-                user = existing_user
-            else:
-                # Create admin user
-                user = User(
+            # Skip the commit-time fsync wait for this one transaction:
+            # bootstrap writes three rows, is idempotent, and can simply
+            # be re-run if a crash loses the commit. SET LOCAL scopes
+            # the setting to the current transaction.
+            if session.bind is not None and session.bind.dialect.name == "postgresql":
+                await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+            # Idempotent insert: ON CONFLICT DO NOTHING + RETURNING gives us
+            # the new id in one statement, with no read-modify-write race.
+            user_id = await session.scalar(
+                pg_insert(User)
+                .values(
                     email=admin_email,
                     password_hash=hash_password(admin_password),
                     is_active=True,
                 )
-                session.add(user)
-                await session.flush()
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.id)
+            )
+
+            if user_id is None:
+                print(f"User '{admin_email}' already exists. Skipping user creation.")
+            else:
                 print(f"Created admin user: {admin_email}")
 
-            # Check if organization already exists
-            result = await session.execute(
-                select(Organization).where(Organization.slug == org_slug)
+            org_id = await session.scalar(
+                pg_insert(Organization)
+                .values(name=org_name, slug=org_slug)
+                .on_conflict_do_nothing(index_elements=["slug"])
+                .returning(Organization.id)
             )
-            existing_org = result.scalar_one_or_none()
 
-            if existing_org:
+            if org_id is None:
                 print(f"Organization '{org_slug}' already exists. Skipping org creation.")
-                org = existing_org
             else:
-                # Create organization
-                org = Organization(
-                    name=org_name,
-                    slug=org_slug,
-                )
-                session.add(org)
-                await session.flush()
                 print(f"Created organization: {org_name} ({org_slug})")
 
-            # Check if membership already exists
-            result = await session.execute(
-                select(Membership).where(
-                    Membership.org_id == org.id,
-                    Membership.user_id == user.id,
-                )
+            # Look up the ids of any pre-existing rows in one round-trip
+            # (a UNION ALL of tagged sub-selects) instead of one SELECT
+            # per entity.
+            if user_id is None or org_id is None:
+                lookups = []
+                if user_id is None:
+                    lookups.append(
+                        select(literal("user").label("kind"), User.id.label("id")).where(
+                            User.email == admin_email
+                        )
+                    )
+                if org_id is None:
+                    lookups.append(
+                        select(literal("org").label("kind"), Organization.id.label("id")).where(
+                            Organization.slug == org_slug
+                        )
+                    )
+                result = await session.execute(union_all(*lookups))
+                found = dict(result.all())
+                user_id = user_id or found.get("user")
+                org_id = org_id or found.get("org")
+
+            membership_id = await session.scalar(
+                pg_insert(Membership)
+                .values(org_id=org_id, user_id=user_id, role=MembershipRole.OWNER)
+                .on_conflict_do_nothing(index_elements=["org_id", "user_id"])
+                .returning(Membership.id)
             )
-            existing_membership = result.scalar_one_or_none()
 
-            if existing_membership:
-                print(f"User already has membership in organization. Skipping.")
+            if membership_id is None:
+                print("User already has membership in organization. Skipping.")
             else:
-                # Create owner membership
-                membership = Membership(
-                    org_id=org.id,
-                    user_id=user.id,
-                    role=MembershipRole.OWNER,
-                )
-                session.add(membership)
-                await session.flush()
-                print(f"Created OWNER membership for user in organization")
+                print("Created OWNER membership for user in organization")
 
             await session.commit()
 
-            print()
-            print("=" * 60)
-            print("Bootstrap Complete!")
-            print("=" * 60)
-            print()
-            print("Admin credentials:")
-            print(f"  Email:    {admin_email}")
-            print(f"  Password: {admin_password}")
-            print()
-            print("Organization:")
-            print(f"  Name: {org_name}")
-            print(f"  Slug: {org_slug}")
-            print()
-            print("Next steps:")
-            print("  1. Login at POST /api/v1/auth/login")
-            print("  2. Create an API key at POST /api/v1/api-keys")
-            print("  3. Use the API key to authenticate agent requests")
-            print()
-            print("IMPORTANT: Change the admin password in production!")
-            print()
+            # One write for the whole banner instead of a syscall per line.
+            banner = "\n".join(
+                [
+                    "",
+                    "=" * 60,
+                    "Bootstrap Complete!",
+                    "=" * 60,
+                    "",
+                    "Admin credentials:",
+                    f"  Email:    {admin_email}",
+                    f"  Password: {admin_password}",
+                    "",
+                    "Organization:",
+                    f"  Name: {org_name}",
+                    f"  Slug: {org_slug}",
+                    "",
+                    "Next steps:",
+                    "  1. Login at POST /api/v1/auth/login",
+                    "  2. Create an API key at POST /api/v1/api-keys",
+                    "  3. Use the API key to authenticate agent requests",
+                    "",
+                    "IMPORTANT: Change the admin password in production!",
+                    "",
+                ]
+            )
+            sys.stdout.write(banner + "\n")
 
         except Exception as e:
             await session.rollback()